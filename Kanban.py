@@ -1,9 +1,10 @@
-from MyKanban import Login
 from MyKanban import License
 
 def main(argv=None):
         
         if License.LicenseInput():
+            # Login pulls in bcrypt, sqlite3 and the CLI, so it is only imported once a license is accepted
+            from MyKanban import Login
             try:
                 Login.Login()
             except KeyboardInterrupt:
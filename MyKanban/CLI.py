@@ -2,7 +2,8 @@ from . import DataStructures
 from pathlib import Path
 from . import Database
 from . import KanbanInfoDatabase as kdb
-from datetime import datetime
+from datetime import datetime, date
+import re
 
 MENU_SCREENS = """
 Kanban - Main Menu
@@ -37,148 +38,182 @@ Quick help:
 
 """
 
-def interactive_menu(store: str):
-    store_path = Path(store)
-    store_path.parent.mkdir(parents=True, exist_ok=True)
-    board = DataStructures.KanbanBoard()
+MENU_DISPLAY = MENU_SCREENS.strip()
+ADMIN_MENU_DISPLAY = ADMIN_MENU_SCREENS.strip()
+HELP_DISPLAY = HELP_TEXT.strip()
+ADMIN_HELP_DISPLAY = ADMIN_HELP_TEXT.strip()
+
+STATUS_MAP = dict(enumerate(DataStructures.VALID_STATUSES, 1))
+
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+ADVICE_HEADER = "\n".join(("\n" + DataStructures.SEPARATOR, f"{'Advice':^50}", DataStructures.SEPARATOR))
+
+def ReadInput(Prompt=""):
+    # Every prompt goes through input(), so terminals keep line editing and tests can patch it whatever stdin is
+    return input(Prompt)
+
+def ParseNumber(Text):
+    # One leading "+" is allowed so international phone numbers still parse; digits passing isdecimal() never make int() raise
+    Digits = Text[1:] if Text[:1] == "+" else Text
+    if Digits.isdecimal():
+        return int(Digits)
+    return None
+
+def ReadInt(Prompt, ErrorMessage="Please enter a valid number."):
+    Number = ParseNumber(ReadInput(Prompt).strip())
+    if Number is not None:
+        return Number
+    if ErrorMessage:
+        print(ErrorMessage)
+    return None
+
+def MenuListTasks(board):
+    board.DisplayBoard()
+
+def MenuAddTask(board):
+    Title = ReadInput("Title: ").strip()
+    if not Title:
+        print("Title cannot be empty.")
+        return
+    Status = HandleStatusInput(Mandatory=True)
+    PersonInCharge = HandlePersonInChargeInput(Mandatory=False, DefaultResponse="Undecided", AdditionalText="(blank to skip)")
+    DueDate = HandleDueDateInput(DefaultResponse="Undecided", Mandatory=False, AllowPastDate=False)
+    Creator = HandleCreatorInput(Mandatory=True, DefaultResponse="Unknown")
+    AdditionalInfo = ReadInput("Additional information (blank to skip): ").strip()
+    board.AddTask(Title, Status, PersonInCharge, DueDate, Creator, AdditionalInfo)
+
+def MenuMoveTask(board):
+    TaskID = ReadInt("Task ID: ")
+    if TaskID is None:
+        return
+    Editor = HandleEditorInput(Mandatory=True)
+    Status = HandleStatusInput(AdditionalText="Blank: Cancel", Mandatory=False)
+
+    board.EditTask(TaskID, Editor, NewStatus=Status)
+
+def MenuEditTask(board):
+    TaskID = ReadInt("Task ID: ")
+    if TaskID is None:
+        return
+    Editor = HandleEditorInput(Mandatory=True)
+    Title = ReadInput("New title (blank to skip): ").strip() or None
+    Status = HandleStatusInput(AdditionalText="Blank: Skip", Mandatory=False)
+    PersonInCharge = HandlePersonInChargeInput(Mandatory=False, DefaultResponse=None, AdditionalText="(blank to skip)")
+    DueDate = HandleDueDateInput(DefaultResponse=None, Mandatory=False, AdditionalText="(blank to skip)")
+    AdditionalInfo = ReadInput("New additional information (blank to skip): ").strip() or None
+    board.EditTask(TaskID, Editor, NewTitle=Title, NewStatus=Status, NewPersonInCharge=PersonInCharge, NewDueDate=DueDate, NewAdditionalInfo=AdditionalInfo)
+
+def MenuDeleteTask(board):
+    TaskIDInput = (ReadInput("Task ID(s) (comma-separated for multiple): ").strip())
+    IDList = [i.strip() for i in TaskIDInput.split(",")]
+    TaskIDs = []
+    SeenIDs = set()
+    for i in IDList:
+        if not i.isdecimal():
+            print("Please enter a valid number")
+        elif i not in SeenIDs:
+            SeenIDs.add(i)
+            TaskIDs.append(i)
+    if not TaskIDs:
+        return
+    if (len(TaskIDs) == 1):
+        ConfirmMessage = f"Confirm remove Task {TaskIDs[0]}? (y/N): "
+    else:
+        IDDisplay = ", ".join(map(str, TaskIDs))
+        ConfirmMessage = f"Confirm remove Tasks {IDDisplay}? (y/N): "
+    Confirm = ReadInput(ConfirmMessage).strip().lower()
+    if Confirm == "y":
+        for TaskID in TaskIDs:
+            board.DelTask(TaskID)
+    else: print("Cancelled.")
+
+def MenuShowTask(board):
+    TaskID = ReadInt("Task ID: ")
+    if TaskID is None:
+        return
+    # IDs are AUTOINCREMENT keys starting at 1, so anything lower cannot exist
+    Temp = kdb.GetTaskByID(TaskID) if TaskID >= 1 else None
+    if Temp is None:
+        print("Task not found.")
+        return
+    DataStructures.Task.FromRow(Temp).DisplayTask()
+
+def MenuAdvice(board):
+    CountTask = kdb.CountTask()
+    print(ADVICE_HEADER)
+    if CountTask[0] > 10:
+        print(f"Attention: Do more tasks! There are {CountTask[0]} to-do Tasks!")
+    if CountTask[1] > 10:
+        print(f"Attention: Work hard! There are {CountTask[1]} tasks in progress!")
+    if CountTask[2] > 10:
+        print(f"Attention: Review Tasks! There are {CountTask[2]} tasks waiting for review!")
+    if CountTask[0] <= 10 and CountTask[1] <= 10 and CountTask[2] <= 10:
+        print("No further advice for Task Status. Keep Going!")
+    CountTaskByPerson = kdb.CountTaskByPerson()
+    UnassignedCount = CountTaskByPerson.get("Unassigned", 0)
+    AssignedOnly = {key: value for key, value in CountTaskByPerson.items() if key != "Unassigned"}
+    OverLoadedPeople = [f"{key} ({value} Tasks)" for key, value in AssignedOnly.items() if value > 3]
+    ChillPeople = [f"{key} ({value} Task(s))" for key, value in AssignedOnly.items() if value < 3]
+    print(DataStructures.SEPARATOR)
+    if UnassignedCount > 0:
+        print(f"Attention: There are {UnassignedCount} unassigned task(s)! Please assign them to someone.")
+    if OverLoadedPeople:
+        print(f"Attention: Too much work for {', '.join(OverLoadedPeople)}!\n           Try to re-distribute tasks!\n")
+    else:
+        print("No one is overloaded. Keep going!")
+    if ChillPeople:
+        print(f"Attention: Try to give some tasks to {', '.join(ChillPeople)}!")
+    else:
+        print("Attention: No one is available for more tasks!")
+    print("\n" + DataStructures.SEPARATOR)
+
+def MenuHelp(board):
+    print(HELP_DISPLAY)
+
+# Stores whose parent directory has already been created this session
+ENSURED_STORES = set()
+
+MENU_ACTIONS = {
+    "1": MenuListTasks,
+    "2": MenuAddTask,
+    "3": MenuMoveTask,
+    "4": MenuEditTask,
+    "5": MenuDeleteTask,
+    "6": MenuShowTask,
+    "7": MenuAdvice,
+    "h": MenuHelp,
+}
+
+def interactive_menu(store: str, board=None):
+    if store not in ENSURED_STORES:
+        Path(store).parent.mkdir(parents=True, exist_ok=True)
+        ENSURED_STORES.add(store)
+    if board is None:
+        board = DataStructures.KanbanBoard()
+    GetAction = MENU_ACTIONS.get
 
     while True:
-        print(MENU_SCREENS.strip())
-        choice = input("> ").strip()
+        print(MENU_DISPLAY)
+        choice = ReadInput("> ")
+        Action = GetAction(choice)
+        if Action is None:
+            # Exact menu keys skip the strip; only other input is normalised
+            choice = choice.strip()
+            Action = GetAction(choice)
 
         if choice == "0":
             print("Logged out.")
             break
-            # return
-
-        elif choice == "1":
-            #List tasks
-            board.DisplayBoard()
-
-        elif choice == "2":
-            #Add task
-            Title = input("Title: ").strip()
-            if not Title:
-                print("Title cannot be empty.")
-                continue
-            Status = HandleStatusInput(Mandatory=True)
-            PersonInCharge = HandlePersonInChargeInput(Mandatory=False, DefaultResponse="Undecided", AdditionalText="(blank to skip)")
-            DueDate = HandleDueDateInput(DefaultResponse="Undecided", Mandatory=False, AllowPastDate=False)
-            Creator = HandleCreatorInput(Mandatory=True, DefaultResponse="Unknown")
-            AdditionalInfo = input("Additional information (blank to skip): ").strip()
-            board.AddTask(Title, Status, PersonInCharge, DueDate, Creator, AdditionalInfo)
-
-        elif choice == "3":
-            #Move task
-            try:
-                TaskID = int(input("Task ID: ").strip())
-            except(ValueError):
-                print("Please enter a valid number.")
-                continue
-            Editor = HandleEditorInput(Mandatory=True)
-            Status = HandleStatusInput(AdditionalText="Blank: Cancel", Mandatory=False)
-
-            board.EditTask(TaskID, Editor, NewStatus=Status)
-
-        elif choice == "4":
-            #Edit task
-            try:
-                TaskID = int(input("Task ID: ").strip())
-            except(ValueError):
-                print("Please enter a valid number.")
-                continue
-            Editor = HandleEditorInput(Mandatory=True)
-            Title = input("New title (blank to skip): ").strip() or None
-            Status = HandleStatusInput(AdditionalText="Blank: Skip", Mandatory=False)
-            PersonInCharge = HandlePersonInChargeInput(Mandatory=False, DefaultResponse=None, AdditionalText="(blank to skip)")
-            DueDate = HandleDueDateInput(DefaultResponse=None, Mandatory=False, AdditionalText="(blank to skip)")
-            AdditionalInfo = input("New additional information (blank to skip): ").strip() or None
-            board.EditTask(TaskID, Editor, NewTitle=Title, NewStatus=Status, NewPersonInCharge=PersonInCharge, NewDueDate=DueDate, NewAdditionalInfo=AdditionalInfo)
-
-        elif choice == "5":
-            #Delete task
-            TaskIDInput = (input("Task ID(s) (comma-separated for multiple): ").strip())
-            IDList = [i.strip() for i in TaskIDInput.split(",")]
-            TaskIDs = []
-            for i in IDList:
-                try:
-                    if (i not in TaskIDs):
-                        TaskID = int(i)
-                        TaskIDs.append(i)
-                except(ValueError):
-                    print("Please enter a valid number")
-                    continue
-            if (len(TaskIDs) == 1):
-                ConfirmMessage = f"Confirm remove Task {TaskIDs[0]}? (y/N): "
-            else:
-                IDDisplay = ", ".join(map(str, TaskIDs))
-                ConfirmMessage = f"Confirm remove Tasks {IDDisplay}? (y/N): "
-            Confirm = input(ConfirmMessage).strip().lower()
-            if Confirm == "y":
-                for TaskID in TaskIDs:
-                    board.DelTask(TaskID)
-            else: print("Cancelled.")
-
-        elif choice == "6":
-            #Show task
-            try:
-                TaskID = int(input("Task ID: ").strip())
-            except(ValueError):
-                print("Please enter a valid number")
-                continue
-            try:
-                Temp = kdb.GetTaskByID(TaskID)
-                if Temp is None:
-                    print("Task not found.")
-                    continue
-                task = DataStructures.Task(Temp[1], Temp[2], Temp[3], Temp[5], Temp[6], Temp[8], Temp[4], Temp[7], Temp[0])
-                task.DisplayTask()
-            except(IndexError):
-                print("Task not found.")
-        
-        elif choice == "7":
-            #Advise
-            CountTask = kdb.CountTask()
-            print("\n" + "-"*50)
-            print(f"{'Advice':^50}")
-            print("-"*50)
-            if CountTask[0] > 10:
-                print(f"Attention: Do more tasks! There are {CountTask[0]} to-do Tasks!")
-            if CountTask[1] > 10:
-                print(f"Attention: Work hard! There are {CountTask[1]} tasks in progress!")
-            if CountTask[2] > 10:
-                print(f"Attention: Review Tasks! There are {CountTask[2]} tasks waiting for review!")
-            if CountTask[0] <= 10 and CountTask[1] <= 10 and CountTask[2] <= 10:
-                print("No further advice for Task Status. Keep Going!")
-            CountTaskByPerson = kdb.CountTaskByPerson()
-            UnassignedCount = CountTaskByPerson.get("Unassigned", 0)
-            AssignedOnly = {key: value for key, value in CountTaskByPerson.items() if key != "Unassigned"}
-            OverLoadedPeople = [f"{key} ({value} Tasks)" for key, value in AssignedOnly.items() if value > 3]
-            ChillPeople = [f"{key} ({value} Task(s))" for key, value in AssignedOnly.items() if value < 3]
-            print("-"*50)
-            if UnassignedCount > 0:
-                print(f"Attention: There are {UnassignedCount} unassigned task(s)! Please assign them to someone.")
-            if OverLoadedPeople:
-                print(f"Attention: Too much work for {', '.join(OverLoadedPeople)}!\n           Try to re-distribute tasks!\n")
-            else:
-                print("No one is overloaded. Keep going!")
-            if ChillPeople:
-                print(f"Attention: Try to give some tasks to {', '.join(ChillPeople)}!")
-            else:
-                print("Attention: No one is available for more tasks!")
-            print("\n" + "-"*50)
-
-        elif choice == "h":
-            print(HELP_TEXT.strip())
-
-        else:
+        if Action is None:
             print("Invalid choice. Please enter a number from the menu.")
+            continue
+        Action(board)
 
-def InteractiveMenuAdmin(store: str):
-
+def InteractiveMenuAdmin(store: str, board=None):
+    # Without a board from the caller, one is built on first use and kept for every later visit to the Kanban system
     while True:
-        print(ADMIN_MENU_SCREENS.strip())
-        choice = input("> ").strip()
+        print(ADMIN_MENU_DISPLAY)
+        choice = ReadInput("> ").strip()
 
         if choice == "0":
             print("Logged out.")
@@ -188,137 +223,96 @@ def InteractiveMenuAdmin(store: str):
         elif choice == "1":
             #Update user activation status
             print("Please enter the phone number of the user.")
-            PhoneNo = int(input("Phone number: ").strip())
+            PhoneNo = ReadInt("Phone number: ", "Please enter a valid phone number.")
+            if PhoneNo is None:
+                continue
             print("The information of the user is as follow:")
-            print(Database.GetUserByPhone(PhoneNo))
+            User = Database.GetUserByPhone(PhoneNo)
+            print(User)
             while True:
-                IsActive = int(input("Please set the activation status of the user (1 for active, 0 otherwise) :").strip())
+                IsActive = ReadInt("Please set the activation status of the user (1 for active, 0 otherwise) :", None)
                 if IsActive == 1 or IsActive == 0:
                     break
                 print("Invalid input.")
             Database.ChangeActivationStatus(PhoneNo, IsActive)
             print("The information has been updated.")
-            print(Database.GetUserByPhone(PhoneNo))
+            if User is not None:
+                # Only the activation status changes, so patch the fetched row instead of querying again
+                User["Activation status"] = IsActive
+            print(User)
 
             
         elif choice == "2":
             #Access Kanban system
-            interactive_menu(store)
+            if board is None:
+                board = DataStructures.KanbanBoard()
+            interactive_menu(store, board=board)
 
         elif choice == "h":
-            print(ADMIN_HELP_TEXT.strip())
+            print(ADMIN_HELP_DISPLAY)
 
         else:
             print("Invalid choice. Please enter a number from the menu.")
 
-def HandlePersonInChargeInput(Mandatory=True, DefaultResponse="Undecided", AdditionalText=""):
+def HandleUserInput(Label, Mandatory=True, DefaultResponse=None, AdditionalText=""):
+    # Shared prompt loop for every "phone number of an existing user" field
+    if AdditionalText != "":
+        AdditionalText = " " + AdditionalText
     while True:
-        if AdditionalText != "":
-            AdditionalText = " " + AdditionalText
-        try:
-            PersonInCharge = input(f"Person in charge (Phone number){AdditionalText}: ").strip() or None
-            if not PersonInCharge and not Mandatory:
-                PersonInCharge = DefaultResponse
-                return PersonInCharge
-            elif not PersonInCharge and Mandatory:
-                print("Person in charge cannot be empty.")
-            else:
-                PersonInCharge = int(PersonInCharge)
-        except(ValueError, TypeError):
+        PhoneNo = ReadInput(f"{Label} (Phone number){AdditionalText}: ").strip()
+        if not PhoneNo:
+            if not Mandatory:
+                return DefaultResponse
+            print(f"{Label} cannot be empty.")
+            continue
+        PhoneNo = ParseNumber(PhoneNo)
+        if PhoneNo is None:
             print("Please enter a valid phone number.")
             continue
-        if kdb.CheckUserExist(PersonInCharge):
+        if kdb.CheckUserExist(PhoneNo):
             break
-        print("Person in charge does not exist.")
-    print(f"Person in charge: {kdb.GetUserByPhone(PersonInCharge)}")
-    return PersonInCharge
+        print(f"{Label} does not exist.")
+    print(f"{Label}: {kdb.GetUserByPhone(PhoneNo)}")
+    return PhoneNo
+
+def HandlePersonInChargeInput(Mandatory=True, DefaultResponse="Undecided", AdditionalText=""):
+    return HandleUserInput("Person in charge", Mandatory, DefaultResponse, AdditionalText)
 
 def HandleCreatorInput(Mandatory=True, DefaultResponse="Unknown", AdditionalText=""):
-    while True:
-        if AdditionalText != "":
-            AdditionalText = " " + AdditionalText
-        try:
-            Creator = input(f"Creator (Phone number){AdditionalText}: ").strip() or None
-            if not Creator and not Mandatory:
-                Creator = DefaultResponse
-                return Creator
-            elif not Creator and Mandatory:
-                print("Creator cannot be empty.")
-                continue
-            else:
-                Creator = int(Creator)
-        except(ValueError, TypeError):
-            print("Please enter a valid phone number.")
-            continue
-        if kdb.CheckUserExist(Creator):
-            break
-        print("Creator does not exist.")
-    print(f"Creator: {kdb.GetUserByPhone(Creator)}")
-    return Creator
+    return HandleUserInput("Creator", Mandatory, DefaultResponse, AdditionalText)
 
 def HandleEditorInput(Mandatory=True, DefaultResponse="Unknown", AdditionalText=""):
-    while True:
-        if AdditionalText != "":
-            AdditionalText = " " + AdditionalText
-        try:
-            Editor = input(f"Editor (Phone number){AdditionalText}: ").strip() or None
-            if not Editor and not Mandatory:
-                Editor = DefaultResponse
-                return Editor
-            elif not Editor and Mandatory:
-                print("Editor cannot be empty.")
-            else:
-                Editor = int(Editor)
-        except(ValueError, TypeError):
-            print("Please enter a valid phone number.")
-            continue
-        if kdb.CheckUserExist(Editor):
-            break
-        elif Editor:
-            print("Editor does not exist.")
-    print(f"Editor: {kdb.GetUserByPhone(Editor)}")
-    return Editor
+    return HandleUserInput("Editor", Mandatory, DefaultResponse, AdditionalText)
 
 def HandleStatusInput(Mandatory=True, AdditionalText=""):
-    while True:  
-        if AdditionalText != "":
-            AdditionalText = " " + AdditionalText
-        StatusInput = input(f"New status (1: To-Do 2: In Progress 3: Waiting Review 4: Finished{AdditionalText}): ").strip()
-        if not Mandatory and not StatusInput:
-            return None
-        if Mandatory and not StatusInput:
+    if AdditionalText != "":
+        AdditionalText = " " + AdditionalText
+    while True:
+        StatusInput = ReadInput(f"New status (1: To-Do 2: In Progress 3: Waiting Review 4: Finished{AdditionalText}): ").strip()
+        if not StatusInput:
+            if not Mandatory:
+                return None
             print("Status cannot be empty")
             continue
-        try:
-            StatusNum = int(StatusInput)
-            if StatusNum == 1:
-                return "To-Do"
-            elif StatusNum == 2:
-                return "In Progress"
-            elif StatusNum == 3:
-                return "Waiting Review"
-            elif StatusNum == 4:
-                return "Finished"
-            else:
-                print("Status is not valid.")
-        except ValueError:
+        if not StatusInput.isdecimal():
             print("Please enter a valid number.")
+            continue
+        Status = STATUS_MAP.get(int(StatusInput))
+        if Status:
+            return Status
+        print("Status is not valid.")
 
 def HandleDueDateInput(Mandatory=True, DefaultResponse=None, AllowPastDate=False, AdditionalText="(blank to skip)"):
     Today = datetime.today().date()
+    if AdditionalText != "":
+        AdditionalText = " " + AdditionalText
     while True:
-        if AdditionalText != "":
-            AdditionalText = " " + AdditionalText
-        DueDateInput = input(f"Due date (YYYY-MM-DD){AdditionalText}: ").strip() or None
+        DueDateInput = ReadInput(f"Due date (YYYY-MM-DD){AdditionalText}: ").strip()
         if DueDateInput:
-            parts = DueDateInput.split("-")
-            if (len(parts) == 3 and
-                parts[0].isdigit() and len(parts[0]) == 4 and  # Year
-                parts[1].isdigit() and len(parts[1]) == 2 and  # Month
-                parts[2].isdigit() and len(parts[2]) == 2):    # Day
+            if DATE_PATTERN.fullmatch(DueDateInput):
                 try:
-                    year, month, day = map(int, parts)
-                    DueDate = datetime(year, month, day).date()
+                    # DATE_PATTERN has already pinned the shape to YYYY-MM-DD, so this only checks the calendar
+                    DueDate = date.fromisoformat(DueDateInput)
                     if DueDate >= Today:
                         return DueDateInput
                     elif AllowPastDate:
@@ -333,15 +327,3 @@ def HandleDueDateInput(Mandatory=True, DefaultResponse=None, AllowPastDate=False
             return DefaultResponse
         else:
             print("Due Date cannot be empty")
-
-"""
-def main(argv=None):
-        try:
-            interactive_menu("~/.kanban/board.json")
-        except KeyboardInterrupt:
-            print("\nBye.")
-        return
-
-if __name__ == "__main__":
-    main()
-"""
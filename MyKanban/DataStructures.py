@@ -1,7 +1,20 @@
+from collections import defaultdict
 from datetime import datetime as dt
+from operator import attrgetter
+from sys import intern
 from . import KanbanInfoDatabase as kdb
 
+# Interned so statuses read back from the database hit the board's bucket keys by identity
+VALID_STATUSES = tuple(map(intern, ("To-Do", "In Progress", "Waiting Review", "Finished")))
+VALID_STATUS_SET = frozenset(VALID_STATUSES)
+
+SEPARATOR = "-"*50
+BOARD_HEADER = ("\n" + SEPARATOR, f"{'Kanban Board':^50}", SEPARATOR)
+
 class Task:
+    # Boards load every row as a Task, so keep instances free of a per-object __dict__
+    __slots__ = ("title", "Status", "PersonInCharge", "CreationDate", "DueDate", "Creator", "Editors", "AdditionalInfo", "ID")
+
     def __init__(self, Title, Status, PersonInCharge, DueDate, Creator, AdditionalInfo, CreationDate=None, Editors=None, ID=None):
         self.title = Title
         self.Status = Status
@@ -13,45 +26,58 @@ class Task:
         self.AdditionalInfo = AdditionalInfo
         self.ID = ID
 
+    @classmethod
+    def FromRow(cls, Row):
+        # Row layout follows the KANBAN table: ID, Title, Status, PersonInCharge, CreationDate, DueDate, Creator, Editors, AdditionalInfo
+        # Stored rows are already complete, so fill the slots directly instead of going through __init__
+        task = cls.__new__(cls)
+        task.ID, task.title, Status, task.PersonInCharge, task.CreationDate, task.DueDate, task.Creator, task.Editors, task.AdditionalInfo = Row
+        task.Status = intern(Status) if type(Status) is str else Status
+        return task
+
     def FormatDate(self, date_obj):
         if isinstance(date_obj, str):
             return date_obj
         if isinstance(date_obj, dt):
-            return date_obj.strftime("%Y-%m-%d %H:%M:%S")
+            # Same text as strftime("%Y-%m-%d %H:%M:%S") for the naive timestamps stored here, without the format parsing
+            return date_obj.isoformat(" ", "seconds")
         return str(date_obj)
     
     def DisplayTask(self):
-        print("\n" + "-"*50)
-        print(f"Task {self.ID}: {self.title}")
-        print("-"*50)
-        
-        # Handle None values safely
-        assigned_to = kdb.GetUserByPhone(self.PersonInCharge) if self.PersonInCharge is not None else "Unassigned"
-        created_by = kdb.GetUserByPhone(self.Creator) if self.Creator is not None else "Unknown"
-        editors = kdb.GetUserByPhone(self.Editors) if self.Editors is not None else "None"
+        # All three people are looked up in one query; handle None values safely
+        Users = kdb.GetUsersByPhones((self.PersonInCharge, self.Creator, self.Editors))
+        assigned_to = Users.get(self.PersonInCharge) if self.PersonInCharge is not None else "Unassigned"
+        created_by = Users.get(self.Creator) if self.Creator is not None else "Unknown"
+        editors = Users.get(self.Editors) if self.Editors is not None else "None"
         
-        print(f"Status: {self.Status}")
-        print(f"Assigned to: {assigned_to}")
-        print(f"CreationTime: {self.FormatDate(self.CreationDate)}")
-        print(f"Due: {self.DueDate}")
-        print(f"Created by: {created_by}")
-        print(f"Editors: {editors}")
-        print(f"Additional Info: {self.AdditionalInfo}")
-        print("\n" + "-"*50)
+        print("\n".join((
+            "\n" + SEPARATOR,
+            f"Task {self.ID}: {self.title}",
+            SEPARATOR,
+            f"Status: {self.Status}",
+            f"Assigned to: {assigned_to}",
+            f"CreationTime: {self.FormatDate(self.CreationDate)}",
+            f"Due: {self.DueDate}",
+            f"Created by: {created_by}",
+            f"Editors: {editors}",
+            f"Additional Info: {self.AdditionalInfo}",
+            "\n" + SEPARATOR,
+        )))
     
     def __str__(self):
         id_str = f"ID: {self.ID}, " if self.ID is not None else ""
         return f"{id_str}Task: {self.title}, Status: {self.Status}, Assigned to: {self.PersonInCharge}, CreationTime: {self.FormatDate(self.CreationDate)}, Due: {self.DueDate}, Created by: {self.Creator}, Editors: {self.Editors}, Additional Info: {self.AdditionalInfo}"
 
 class KanbanBoard:
+    __slots__ = ()
+    ValidStatus = VALID_STATUSES
+
     def __init__(self):
         kdb.InitDB()
-        self.ValidStatus = ["To-Do", "In Progress", "Waiting Review", "Finished"]
 
     def AddTask(self, Title, Status, PersonInCharge, DueDate, Creator, AdditionalInfo):
-        if Status in self.ValidStatus:
-            task = Task(Title, Status, PersonInCharge, DueDate, Creator, AdditionalInfo)
-            kdb.AddTask(Title, Status, PersonInCharge, task.CreationDate, DueDate, Creator, AdditionalInfo)
+        if Status in VALID_STATUS_SET:
+            kdb.AddTask(Title, Status, PersonInCharge, dt.now(), DueDate, Creator, AdditionalInfo)
             print(f"Added: {Title}")
             return True
         else:
@@ -65,40 +91,16 @@ class KanbanBoard:
                 print("Task not found.")
                 return False
             
-            task = Task(
-                Temp[1],  # Title
-                Temp[2],  # Status
-                Temp[3],  # PersonInCharge
-                Temp[5],  # DueDate
-                Temp[6],  # Creator
-                Temp[8],  # AdditionalInfo
-                Temp[4],  # CreationDate
-                Temp[7],  # Editors
-                Temp[0]   # ID
-            )
-            
-            # Update editor
-            task.Editors = Editor
-            
             # Validate status before applying
-            if NewStatus and NewStatus not in self.ValidStatus:
+            if NewStatus and NewStatus not in VALID_STATUS_SET:
                 print(f"Edit Task Failed: Status '{NewStatus}' is not valid.")
                 return False
             
-            # Apply updates
-            if NewTitle:
-                task.title = NewTitle
-            if NewStatus:
-                task.Status = NewStatus
-            if NewPersonInCharge:
-                task.PersonInCharge = NewPersonInCharge
-            if NewDueDate:
-                task.DueDate = NewDueDate
-            if NewAdditionalInfo:
-                task.AdditionalInfo = NewAdditionalInfo
-                
-            kdb.EditTask(index, task.title, task.Status, task.PersonInCharge, task.DueDate, task.Editors, task.AdditionalInfo)
-            print(f"Task updated: {task.title}")
+            # Blank updates keep the stored value, so merge straight from the row without building a Task
+            _, Title, Status, PersonInCharge, _, DueDate, _, _, AdditionalInfo = Temp
+            Title = NewTitle or Title
+            kdb.EditTask(index, Title, NewStatus or Status, NewPersonInCharge or PersonInCharge, NewDueDate or DueDate, Editor, NewAdditionalInfo or AdditionalInfo)
+            print(f"Task updated: {Title}")
             return True
             
         except (IndexError, TypeError) as e:
@@ -112,20 +114,9 @@ class KanbanBoard:
                 print("Task not found.")
                 return False
     
-            removed_task = Task(
-                Temp[1],  # Title
-                Temp[2],  # Status
-                Temp[3],  # PersonInCharge
-                Temp[5],  # DueDate
-                Temp[6],  # Creator
-                Temp[8],  # AdditionalInfo
-                Temp[4],  # CreationDate
-                Temp[7],  # Editors
-                Temp[0]   # ID
-            )
-            
             kdb.DelTask(index)
-            print(f"Deleted: {removed_task.title}")
+            # Only the title is reported, so read it from the row instead of building a Task
+            print(f"Deleted: {Temp[1]}")
             return True
             
         except (IndexError, TypeError) as e:
@@ -133,34 +124,34 @@ class KanbanBoard:
             return False
 
     def DisplayBoard(self):
-        temp = kdb.GetAllTasks()
-        tasks = []
-        for i in temp:
-            # FIXED: Correct parameter order
-            tasks.append(Task(i[1], i[2], i[3], i[5], i[6], i[8], i[4], i[7], i[0]))
-        
-        # Sort tasks by due date (safer string sorting)
-        try:
-            sorted_tasks = sorted(tasks, key=lambda x: x.DueDate)
-        except Exception:
-            sorted_tasks = tasks  # Fallback if sorting fails
+        tasks = [Task.FromRow(row) for row in kdb.GetAllTasks()]
         
-        # Group tasks by status
-        grouped_tasks = {status: [] for status in self.ValidStatus}
-        for task in sorted_tasks:
-            if task.Status in grouped_tasks:
-                grouped_tasks[task.Status].append(task)
+        # Group tasks by status; statuses outside ValidStatus are simply never read back
+        grouped_tasks = defaultdict(list)
+        for task in tasks:
+            grouped_tasks[task.Status].append(task)
         
-        print("\n" + "-"*50)
-        print(f"{'Kanban Board':^50}")
-        print("-"*50)
+        # Collect the whole board and print it once rather than line by line
+        lines = list(BOARD_HEADER)
+        append = lines.append
         
+        Users = kdb.GetUsersByPhones(task.PersonInCharge for task in tasks)
+        DueDateKey = attrgetter("DueDate")
         for status in self.ValidStatus:
-            if grouped_tasks[status]: 
-                print(f"\n{status.upper()}:")
-                for task in grouped_tasks[status]:
-                    person_info = kdb.GetUserByPhone(task.PersonInCharge)
-                    person_name = person_info[0] if person_info and len(person_info) > 0 else "Unknown"
-                    print(f" - Task {task.ID}: {task.title} (Due: {task.DueDate}, Assigned to: {person_name})")
+            bucket = grouped_tasks.get(status)
+            if not bucket:
+                continue
+            # Sort each status by due date (safer string sorting); smaller buckets sort cheaper than the whole board
+            try:
+                bucket = sorted(bucket, key=DueDateKey)
+            except Exception:
+                pass  # Fallback if sorting fails
+            append(f"\n{status.upper()}:")
+            for task in bucket:
+                ID, title, DueDate = task.ID, task.title, task.DueDate
+                person_info = Users.get(task.PersonInCharge)
+                person_name = person_info[0] if person_info and len(person_info) > 0 else "Unknown"
+                append(f" - Task {ID}: {title} (Due: {DueDate}, Assigned to: {person_name})")
         
-        print("\n" + "-"*50)
+        lines.append("\n" + SEPARATOR)
+        print("\n".join(lines))
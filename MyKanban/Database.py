@@ -3,21 +3,40 @@ from pathlib import Path
 import bcrypt
 
 DB_PATH = Path("kanban.db")
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS USER (
+        ID INTEGER PRIMARY KEY AUTOINCREMENT,
+        PhoneNo INTEGER NOT NULL UNIQUE,
+        Name VARCHAR2(100) NOT NULL,
+        IsActive INTEGER NOT NULL DEFAULT 1,
+        Position VARCHAR2(50) NOT NULL,
+        PasswordHash TEXT NOT NULL
+    );
+"""
+
+# Databases whose USER table has already been created this session
+INITIALISED_PATHS = set()
+
+SharedConnection = None
+SharedConnectionPath = None
+
+def GetConnection():
+    # One connection is kept for the session and only reopened when DB_PATH is pointed elsewhere
+    global SharedConnection, SharedConnectionPath
+    if SharedConnection is None or SharedConnectionPath != DB_PATH:
+        if SharedConnection is not None:
+            SharedConnection.close()
+        SharedConnection = sqlite3.connect(DB_PATH, uri=True)
+        SharedConnectionPath = DB_PATH
+    return SharedConnection
 
 def InitDB():
-    Connection = sqlite3.connect(DB_PATH)
-    Connection.execute("""
-        CREATE TABLE IF NOT EXISTS USER (
-            ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            PhoneNo INTEGER NOT NULL UNIQUE,
-            Name VARCHAR2(100) NOT NULL,
-            IsActive INTEGER NOT NULL DEFAULT 1,
-            Position VARCHAR2(50) NOT NULL,
-            PasswordHash TEXT NOT NULL
-        )
-    """)
+    if DB_PATH in INITIALISED_PATHS:
+        return
+    Connection = GetConnection()
+    Connection.executescript(SCHEMA)
     Connection.commit()
-    Connection.close()
+    INITIALISED_PATHS.add(DB_PATH)
 
 def DisplayData(row) -> dict:
     if row is None:
@@ -38,6 +57,9 @@ def HashPassword(password: str) -> str:
     return hashed.decode("utf-8")
 
 def VerifyPassword(password: str, password_hash: str) -> bool:
+    # Missing or empty values can never match a stored hash, so they are turned away before reaching bcrypt
+    if not isinstance(password, str) or not isinstance(password_hash, str) or not password or not password_hash:
+        return False
     try:
         return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
     except Exception:
@@ -45,24 +67,37 @@ def VerifyPassword(password: str, password_hash: str) -> bool:
 
 def CreateUser(PhoneNo: int, Name: str, Position: str, Password: str):
     PasswordHash = HashPassword(Password)
-    Connection = sqlite3.connect(DB_PATH)
+    Connection = GetConnection()
+    # Admins start active, everyone else waits for an admin to activate them
+    IsActive = 1 if Position == "Admin" else 0
     try:
-        if Position == "Admin":
-            Connection.execute("INSERT INTO USER (PhoneNo, Name, Position, PasswordHash) VALUES (?, ?, ?, ?)", (PhoneNo, Name, Position, PasswordHash))
-            Connection.commit()
-        else:
-            Connection.execute("INSERT INTO USER (PhoneNo, Name, IsActive, Position, PasswordHash) VALUES (?, ?, ?, ?, ?)", (PhoneNo, Name, 0, Position, PasswordHash))
-            Connection.commit()
+        Query = Connection.execute("INSERT INTO USER (PhoneNo, Name, IsActive, Position, PasswordHash) VALUES (?, ?, ?, ?, ?)", (PhoneNo, Name, IsActive, Position, PasswordHash))
+        Connection.commit()
     except sqlite3.IntegrityError:
         raise ValueError("Phone number already exists")
     finally:
-        Connection.close()
+        # The connection stays open, so a failed insert must not keep holding the write lock
+        if Connection.in_transaction:
+            Connection.rollback()
+    # Every stored value is already known here, so the new record is returned without reading it back
+    return DisplayData((Query.lastrowid, PhoneNo, Name, IsActive, Position, PasswordHash))
+
+def CreateUsers(Users):
+    # Hashing happens before the transaction opens, so the write lock is held for the inserts alone
+    Rows = [(PhoneNo, Name, 1 if Position == "Admin" else 0, Position, HashPassword(Password)) for PhoneNo, Name, Position, Password in Users]
+    Connection = GetConnection()
+    try:
+        # One transaction and one commit for the whole batch; any duplicate rolls every row back
+        with Connection:
+            Connection.executemany("INSERT INTO USER (PhoneNo, Name, IsActive, Position, PasswordHash) VALUES (?, ?, ?, ?, ?)", Rows)
+    except sqlite3.IntegrityError:
+        raise ValueError("Phone number already exists")
 
 def GetUserByPhone(PhoneNo: int):
-    Connection = sqlite3.connect(DB_PATH)
-    Query = Connection.execute("SELECT * FROM USER WHERE PhoneNo = ?", (PhoneNo,))
+    Connection = GetConnection()
+    Query = Connection.execute("SELECT ID, PhoneNo, Name, IsActive, Position, PasswordHash FROM USER WHERE PhoneNo = ?", (PhoneNo,))
     Data = Query.fetchone()
-    Connection.close()
+    Query.close()
     return DisplayData(Data)
 
 def ValidateLogin(PhoneNo: int, Password: str) -> dict | None:
@@ -78,6 +113,6 @@ def ValidateLogin(PhoneNo: int, Password: str) -> dict | None:
     return None
 
 def ChangeActivationStatus(PhoneNo: int, IsActive: int):
-    Connection = sqlite3.connect(DB_PATH)
+    Connection = GetConnection()
     Connection.execute("UPDATE USER SET IsActive = ? WHERE PhoneNo = ?", (IsActive, PhoneNo))
     Connection.commit()
\ No newline at end of file
@@ -2,32 +2,56 @@ import sqlite3
 from pathlib import Path
 
 DB_PATH = Path("kanban.db")
+STATUSES = ("To-Do", "In Progress", "Waiting Review", "Finished")
+# Applied in one executescript call so the whole schema is set up in a single pass
+SCHEMA = """
+    PRAGMA foreign_keys = ON;
+    CREATE TABLE IF NOT EXISTS KANBAN (
+        ID INTEGER PRIMARY KEY AUTOINCREMENT,
+        Title TEXT NOT NULL,
+        Status TEXT NOT NULL,
+        PersonInCharge INTEGER NOT NULL,
+        CreationDate TEXT NOT NULL,
+        DueDate TEXT NOT NULL,           
+        Creator INTEGER NOT NULL,
+        Editors INTEGER,
+        AdditionalInfo TEXT,
+        FOREIGN KEY (PersonInCharge) REFERENCES USER(PhoneNo) ON UPDATE CASCADE ON DELETE RESTRICT,
+        FOREIGN KEY (Creator) REFERENCES USER(PhoneNo) ON UPDATE CASCADE ON DELETE RESTRICT
+        );
+    CREATE INDEX IF NOT EXISTS KANBAN_DUE_DATE ON KANBAN (DueDate);
+"""
+# Names never change once a user exists, so found users are kept per database; misses are not cached
+USER_CACHE = {}
+# Databases whose schema has already been created this session
+INITIALISED_PATHS = set()
+
+SharedConnection = None
+SharedConnectionPath = None
+
+def GetConnection():
+    # Reusing one connection lets sqlite3's statement cache skip re-preparing the same queries
+    global SharedConnection, SharedConnectionPath
+    if SharedConnection is None or SharedConnectionPath != DB_PATH:
+        if SharedConnection is not None:
+            SharedConnection.close()
+        SharedConnection = sqlite3.connect(DB_PATH, uri=True)
+        SharedConnectionPath = DB_PATH
+    return SharedConnection
 
 def InitDB():
-    Connection = sqlite3.connect(DB_PATH)
-    Connection.execute("PRAGMA foreign_keys = ON")
-    Connection.execute("""
-        CREATE TABLE IF NOT EXISTS KANBAN (
-            ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            Title TEXT NOT NULL,
-            Status TEXT NOT NULL,
-            PersonInCharge INTEGER NOT NULL,
-            CreationDate TEXT NOT NULL,
-            DueDate TEXT NOT NULL,           
-            Creator INTEGER NOT NULL,
-            Editors INTEGER,
-            AdditionalInfo TEXT,
-            FOREIGN KEY (PersonInCharge) REFERENCES USER(PhoneNo) ON UPDATE CASCADE ON DELETE RESTRICT,
-            FOREIGN KEY (Creator) REFERENCES USER(PhoneNo) ON UPDATE CASCADE ON DELETE RESTRICT
-            )
-    """)
+    if DB_PATH in INITIALISED_PATHS:
+        return
+    Connection = sqlite3.connect(DB_PATH, uri=True)
+    Connection.executescript(SCHEMA)
     Connection.commit()
     Connection.close()
+    INITIALISED_PATHS.add(DB_PATH)
 
 def FormatDate(date_obj):                
     if isinstance(date_obj, str):
         return date_obj
-    return date_obj.strftime("%Y-%m-%d %H:%M:%S")
+    return date_obj.isoformat(" ", "seconds")
 
 def DisplayData(row) -> dict:
     #For testing only, not used
@@ -49,88 +73,118 @@ def DisplayData(row) -> dict:
     }
 
 def AddTask(Title, Status, PersonInCharge, CreationDate, DueDate, Creator, AdditionalInfo):
-    Connection = sqlite3.connect(DB_PATH)
+    Connection = GetConnection()
     Connection.execute("INSERT INTO KANBAN (Title, Status, PersonInCharge, CreationDate, DueDate, Creator, AdditionalInfo) VALUES (?, ?, ?, ?, ?, ?, ?)", (Title, Status, PersonInCharge, FormatDate(CreationDate), DueDate, Creator, AdditionalInfo))
     Connection.commit()
-    Connection.close()
+
+def AddTasks(Tasks):
+    # Rows take AddTask's argument order; one transaction and one commit for the whole batch
+    Rows = [(Title, Status, PersonInCharge, FormatDate(CreationDate), DueDate, Creator, AdditionalInfo) for Title, Status, PersonInCharge, CreationDate, DueDate, Creator, AdditionalInfo in Tasks]
+    Connection = GetConnection()
+    with Connection:
+        Connection.executemany("INSERT INTO KANBAN (Title, Status, PersonInCharge, CreationDate, DueDate, Creator, AdditionalInfo) VALUES (?, ?, ?, ?, ?, ?, ?)", Rows)
 
 def DelTask(TaskID):
-    Connection = sqlite3.connect(DB_PATH)
+    Connection = GetConnection()
     Connection.execute("DELETE FROM KANBAN WHERE ID = ?", (TaskID,))
     Connection.commit()
-    Connection.close()
 
 def EditTask(TaskID, NewTitle, NewStatus, NewPersonInCharge, NewDueDate, Editors, NewAdditionalInfo):
-    Connection = sqlite3.connect(DB_PATH)
+    Connection = GetConnection()
     Connection.execute("UPDATE KANBAN SET Title = ?, Status = ?, PersonInCharge = ?, DueDate = ?, Editors = ?, AdditionalInfo = ? WHERE ID = ? ", (NewTitle, NewStatus, NewPersonInCharge, NewDueDate, Editors, NewAdditionalInfo, TaskID))
     Connection.commit()
-    Connection.close()
 
 def GetAllTasks():
-    Connection = sqlite3.connect(DB_PATH)
+    Connection = GetConnection()
     Query = Connection.execute("SELECT * FROM KANBAN")
     Data = Query.fetchall()
-    Connection.close()
-    return [[Datum[0], Datum[1], Datum[2], Datum[3], Datum[4], Datum[5], Datum[6], Datum[7], Datum[8]] for Datum in Data]
+    # Rows are handed out as sqlite3's own tuples; callers only index or unpack them
+    return Data
 
 def GetTaskByID(TaskID):
-    Connection = sqlite3.connect(DB_PATH)
+    Connection = GetConnection()
     Query = Connection.execute("SELECT * FROM KANBAN WHERE ID = ?", (TaskID,))
     Data = Query.fetchone()
-    Connection.close()
-    return [Data[0], Data[1], Data[2], Data[3], Data[4], Data[5], Data[6], Data[7], Data[8]] if Data else None
+    Query.close()
+    return Data
 
 def GetUserByPhone(PhoneNo: int):
-    Connection = sqlite3.connect(DB_PATH)
+    Key = (DB_PATH, PhoneNo)
+    User = USER_CACHE.get(Key)
+    if User is not None:
+        return User
+    Connection = GetConnection()
     Query = Connection.execute("SELECT PhoneNo, Name FROM User WHERE PhoneNo = ?", (PhoneNo,))
     Data = Query.fetchone()
-    Connection.close()
-    return [Data[1]] if Data else None
+    Query.close()
+    if not Data:
+        return None
+    User = USER_CACHE[Key] = [Data[1]]
+    return User
+
+def GetUsersByPhones(PhoneNos):
+    # Cached users are answered directly and the rest share one IN query; values match GetUserByPhone's [Name] shape
+    Users = {}
+    Missing = []
+    for PhoneNo in set(PhoneNos):
+        if PhoneNo is None:
+            continue
+        User = USER_CACHE.get((DB_PATH, PhoneNo))
+        if User is None:
+            Missing.append(PhoneNo)
+        else:
+            Users[PhoneNo] = User
+    if not Missing:
+        return Users
+    Connection = GetConnection()
+    Query = Connection.execute(f"SELECT PhoneNo, Name FROM User WHERE PhoneNo IN ({', '.join('?' * len(Missing))})", Missing)
+    for PhoneNo, Name in Query.fetchall():
+        Users[PhoneNo] = USER_CACHE[(DB_PATH, PhoneNo)] = [Name]
+    return Users
 
 def CheckUserExist(PhoneNo: int):
-    Connection = sqlite3.connect(DB_PATH)
-    Query = Connection.execute("SELECT * FROM User WHERE PhoneNo = ?", (PhoneNo,))
+    Connection = GetConnection()
+    Query = Connection.execute("SELECT 1 FROM User WHERE PhoneNo = ?", (PhoneNo,))
     Data = Query.fetchone()
-    Connection.close()
+    Query.close()
     return True if Data else False
 
 def GetTaskByPIC():
-    Connection = sqlite3.connect(DB_PATH)
+    Connection = GetConnection()
     Query = Connection.execute("SELECT KANBAN.ID, KANBAN.Title, KANBAN.Status, USER.Name, KANBAN.CreationDate, KANBAN.DueDate, KANBAN.Creator, KANBAN.Editors, KANBAN.AdditionalInfo FROM KANBAN, USER WHERE USER.ID = KANBAN.PersonInCharge")
     Data = Query.fetchone()
-    Connection.close()
+    Query.close()
     print(Data)
     return [[Datum[0], Datum[1], Datum[2], Datum[3], Datum[4], Datum[5], Datum[6], Datum[7], Datum[8]] for Datum in Data]
 
 def CountTask():
-    Connection = sqlite3.connect(DB_PATH)
-    Statuses = ["To-Do", "In Progress", "Waiting Review", "Finished"]
-    data = []
-    for Status in Statuses:
-        query = Connection.execute("SELECT COUNT(*) FROM KANBAN WHERE Status = ?", (Status,))
-        count = query.fetchone()[0]
-        data.append(count)
-    Connection.close()
+    Connection = GetConnection()
+    Counts = dict(Connection.execute("SELECT Status, COUNT(*) FROM KANBAN GROUP BY Status"))
+    data = [Counts.get(Status, 0) for Status in STATUSES]
     return data
 
 def CountTaskByPerson():
-    Connection = sqlite3.connect(DB_PATH)
+    Connection = GetConnection()
     query = Connection.execute("SELECT PersonInCharge, COUNT(*) FROM KANBAN GROUP BY PersonInCharge")
     data = query.fetchall()
-    Connection.close()
+    # Resolve every assignee in one query rather than one lookup per group
+    Phones = {}
+    for person_phone, count in data:
+        try:
+            Phones[person_phone] = int(person_phone)
+        except (ValueError, TypeError):
+            pass
+    Users = GetUsersByPhones(Phones.values())
     result = {}
     for person_phone, count in data:
-        if person_phone is None:
+        phone_int = Phones.get(person_phone)
+        if phone_int is None:
             name = "Unassigned"
         else:
-            try:
-                phone_int = int(person_phone)  
-                user_data = GetUserByPhone(phone_int)
-                if user_data and len(user_data) > 0:
-                    name = f"{user_data[0]} ({phone_int})" 
-                else:
-                    name = f"Unknown ({phone_int})"
-            except (ValueError, TypeError):
-                name = "Unassigned"
+            user_data = Users.get(phone_int)
+            if user_data and len(user_data) > 0:
+                name = f"{user_data[0]} ({phone_int})" 
+            else:
+                name = f"Unknown ({phone_int})"
         result[name] = count
     return result
@@ -1,6 +1,8 @@
 from pathlib import Path
 
 LICENSE_FILE = Path("MyKanban/license_keys.txt")
+# Keys read from each license file, so repeated attempts do not reopen it
+LICENSE_KEY_CACHE = {}
 
 def LicenseInput() -> bool:
     Trial = 3
@@ -33,6 +35,7 @@ def LoadLicenseKeys() -> set[str]:
 def ValidateLicense(key: str) -> bool:
     if key is None:
         return False
-    keys = LoadLicenseKeys()
-    match = key in keys
-    return match
\ No newline at end of file
+    keys = LICENSE_KEY_CACHE.get(LICENSE_FILE)
+    if keys is None:
+        keys = LICENSE_KEY_CACHE[LICENSE_FILE] = frozenset(LoadLicenseKeys() or ())
+    return key in keys
\ No newline at end of file
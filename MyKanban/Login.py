@@ -1,6 +1,7 @@
+import hmac
 from . import Database
 from . import CLI
-from . import Notification
+from . import DataStructures
 from . import KanbanInfoDatabase as kdb
 
 LOGIN_PAGE = """
@@ -24,10 +25,12 @@ def Login():
 
     Database.InitDB()
     printnoti = True
+    # One board serves every login in this session
+    board = None
     
     while True:
         print(LOGIN_PAGE.strip())
-        choice = input("> ").strip()
+        choice = CLI.ReadInput("> ").strip()
 
         if choice == "0":
             print("Thank you for using our system.")
@@ -35,25 +38,14 @@ def Login():
 
         elif choice == "1":
             # Login
-            try:
-                PhoneNo = int(input("Phone number: ").strip())
-            except (ValueError, TypeError):
-                print("Please enter a valid phone number")
+            PhoneNo = CLI.ReadInt("Phone number: ", "Please enter a valid phone number")
+            if PhoneNo is None:
                 continue
-            Password = input("Password: ").strip()
+            Password = CLI.ReadInput("Password: ").strip()
             User = Database.ValidateLogin(PhoneNo, Password)
             if User and User != "Not activated":
-                print(f"\nLogin successfully.\n")
-                if User.get("Position") == "Admin":
-                    if printnoti:
-                        Notification.PrintNotification()
-                        printnoti = False
-                    CLI.InteractiveMenuAdmin("~/.kanban/board.json")
-                else: 
-                    if printnoti:
-                        Notification.PrintNotification()
-                        printnoti = False
-                    CLI.interactive_menu("~/.kanban/board.json")
+                board = StartSession(User, board, printnoti)
+                printnoti = False
             elif User == "Not activated":
                 print("Account inactive, please contact an admin.")
             else:
@@ -61,36 +53,31 @@ def Login():
 
         elif choice == "2":
             # Register
-            try:
-                PhoneNo = int(input("Phone number: ").strip())
-                if kdb.CheckUserExist(PhoneNo):
-                    print("Phone number already exists.")
-                    continue
-            except (ValueError, TypeError):
-                print("Please enter a valid phone number")
+            PhoneNo = CLI.ReadInt("Phone number: ", "Please enter a valid phone number")
+            if PhoneNo is None:
+                continue
+            if kdb.CheckUserExist(PhoneNo):
+                print("Phone number already exists.")
                 continue
             while True:
-                Name = input("Name: ").strip()
+                Name = CLI.ReadInput("Name: ").strip()
                 if Name != "Not activated":
                     break
                 print("Invalid name.")
             while True:
-                Position = input("Position (Admin / User): ").strip().capitalize()
+                Position = CLI.ReadInput("Position (Admin / User): ").strip().capitalize()
                 if Position == "User":
                     break
                 elif Position == "Admin":
-                    try:
-                        ValidationKey = int(input("Validation key: ").strip())
-                        if ValidationKey == VALIDATION_KEY:  
-                            break
-                    except (ValueError, TypeError):
-                        print("Invalid key")
+                    ValidationKey = CLI.ReadInt("Validation key: ", "Invalid key")
+                    if ValidationKey == VALIDATION_KEY:
+                        break
                     print("Validation key mismatch.")
                 else: print("Invalid position.")
             Password = PasswordInput()
-            Database.CreateUser(PhoneNo, Name, Position, Password)
+            User = Database.CreateUser(PhoneNo, Name, Position, Password)
             print("\nYou have registered the following account:")
-            print(Database.GetUserByPhone(PhoneNo))
+            print(User)
             print("")
 
         elif choice == "h":
@@ -99,14 +86,34 @@ def Login():
         else:
             print("Invalid choice. Please enter a number from the menu.")
 
+def StartSession(User, board=None, ShowNotifications=True):
+    # Everything after a successful login; returns the board so later logins in the same run reuse it
+    print(f"\nLogin successfully.\n")
+    if ShowNotifications:
+        # Notifications are only needed after a successful login, so load them on first use
+        from . import Notification
+        Notification.PrintNotification()
+    if board is None:
+        board = DataStructures.KanbanBoard()
+    if User.get("Position") == "Admin":
+        CLI.InteractiveMenuAdmin("~/.kanban/board.json", board=board)
+    else: 
+        CLI.interactive_menu("~/.kanban/board.json", board=board)
+    return board
+
+def PasswordError(pw1, pw2):
+    # Compared as bytes so the check takes the same time wherever the two entries differ
+    if not hmac.compare_digest(pw1.encode("utf-8"), pw2.encode("utf-8")):
+        return "Passwords do not match. Please try again."
+    if len(pw1) < 8:
+        return "Password too short (min 8 chars). Please try again."
+    return None
+
 def PasswordInput():
     while True:
-        pw1 = input("Password: ").strip()
-        pw2 = input("Confirm password: ").strip()
-        if pw1 != pw2:
-            print("Passwords do not match. Please try again.")
-            continue
-        if len(pw1) < 8:
-            print("Password too short (min 8 chars). Please try again.")
-            continue
-        return pw1    
\ No newline at end of file
+        pw1 = CLI.ReadInput("Password: ").strip()
+        pw2 = CLI.ReadInput("Confirm password: ").strip()
+        Error = PasswordError(pw1, pw2)
+        if Error is None:
+            return pw1
+        print(Error)    
\ No newline at end of file
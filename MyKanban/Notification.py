@@ -1,20 +1,32 @@
-from datetime import datetime, timedelta
+from datetime import datetime, date, time, timedelta
 from . import KanbanInfoDatabase as kdb
 import sqlite3
+import re
 from pathlib import Path
 
 DB_PATH = Path("kanban.db")
 Due = 14
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+SEPARATOR = "\n" + "-"*50 + "\n"
 
 def UpcomingTask():
     Now = datetime.now()
+    Today = Now.date()
+    # Deadlines fall at the end of their day, so the rest of today is worked out once and each task adds whole days
+    TodayLeft = datetime.combine(Today, time.max) - Now
     Threshold = Now + timedelta(days=Due)
+    LastDay = Threshold.date()
+    # ISO dates order the same as text, so rows past the window are dropped before any parsing
+    LastDayText = LastDay.isoformat()
+    # Padded values like "2024-01-01 " still sort before the following day, so this bound never drops a due row;
+    # dates stored without zero padding are shorter than ten characters and are let through to be parsed below
+    AfterWindowText = (LastDay + timedelta(days=1)).isoformat()
 
-    Connection = sqlite3.connect(DB_PATH)
+    Connection = sqlite3.connect(DB_PATH, uri=True)
     Query = Connection.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'KANBAN'")
     Data = Query.fetchone()
     if Data is not None:
-        Query = Connection.execute("SELECT * FROM KANBAN")
+        Query = Connection.execute("SELECT ID, Title, Status, PersonInCharge, CreationDate, DueDate, Creator, Editors, AdditionalInfo FROM KANBAN WHERE (DueDate < ? OR length(trim(DueDate)) < 10) AND lower(trim(Status)) <> 'finished' ORDER BY ID", (AfterWindowText,))
         Data = Query.fetchall()
         Connection.close()
     else:
@@ -22,67 +34,65 @@ def UpcomingTask():
         return []
 
     Notifications = []
-    Notifications.append("\n" + "-"*50 + "\n")
+    Notifications.append(SEPARATOR)
+    Users = kdb.GetUsersByPhones(Phone for Datum in Data for Phone in (Datum[3], Datum[6], Datum[7]))
 
-    for Datum in Data:
-        TaskID = Datum[0]
-        Title = Datum[1]
-        Status = Datum[2]
-        PersonInCharge = Datum[3]
-        CreationDate = Datum[4]
-        DueDateStr = Datum[5]
-        Creator = Datum[6]
-        Editor = Datum[7]
-        AddtionalInfo = Datum[8]
-        
+    for TaskID, Title, Status, PersonInCharge, CreationDate, DueDateStr, Creator, Editor, AddtionalInfo in Data:
         if Status.strip().lower() == "finished":
             continue
-        if not isinstance(DueDateStr, str) or not DueDateStr.strip():
+        if not isinstance(DueDateStr, str):
             continue
-        try:
-            DueDate_base = datetime.strptime(DueDateStr.strip(), "%Y-%m-%d")
-            DueDate = DueDate_base.replace(hour=23, minute=59, second=59, microsecond=999999)
-        except (ValueError, TypeError):
-            continue
-        if DueDate.date() < Now.date() or (Now.date() <= DueDate.date() <= Threshold.date()):
-            TimeLeft = DueDate - Now
-            if TimeLeft < timedelta(0):
-                OverdueDelta = -TimeLeft  
-                Days = OverdueDelta.days
-                Hours = int(OverdueDelta.seconds // 3600)
-                Minutes = int((OverdueDelta.seconds % 3600) // 60)
-                DueIn = f"{Days}d {Hours:02d}h {Minutes:02d}m"
-                DueMessage = f"[Task overdue by {DueIn}]\n"
-            else:
-                Days = TimeLeft.days
-                Hours = int(TimeLeft.seconds // 3600)
-                Minutes = int((TimeLeft.seconds % 3600) // 60)
-                DueIn = f"{Days}d {Hours:02d}h {Minutes:02d}m"
-                if DueDate_base.date() == Now.date():
-                    DueIn = f"0d {Hours:02d}h {Minutes:02d}m"
-                DueMessage = f"[Task due in {DueIn}]\n"
-            PersonInCharge = kdb.GetUserByPhone(PersonInCharge)
-            Creator = kdb.GetUserByPhone(Creator)
-            Editor = kdb.GetUserByPhone(Editor)
-            Message = [
-                f"{DueMessage}",
-                f"Task ID: {TaskID}\n",
-                f"Title: {Title}\n",
-                f"Status: {Status}\n",
-                f"Person in charge: {PersonInCharge}\n",
-                f"Creation date: {CreationDate}\n",
-                f"Due date: {DueDateStr}\n",
-                f"Creator: {Creator}\n",
-                f"Editor: {Editor}\n",
-                f"Additional information: {AddtionalInfo}",
-            ]
-            Notifications.append("".join(Message))
-            Notifications.append("\n" + "-"*50 + "\n")
+        DueText = DueDateStr.strip()
+        if DATE_PATTERN.fullmatch(DueText):
+            if DueText > LastDayText:
+                continue
+            try:
+                DueDay = date.fromisoformat(DueText)
+            except ValueError:
+                continue
+        else:
+            # Dates stored without zero padding, such as "2024-1-5", are still read; placeholders like "Undecided" fail here
+            try:
+                DueDay = datetime.strptime(DueText, "%Y-%m-%d").date()
+            except ValueError:
+                continue
+            if DueDay > LastDay:
+                continue
+        TimeLeft = TodayLeft + (DueDay - Today)
+        Overdue = TimeLeft < timedelta(0)
+        Delta = -TimeLeft if Overdue else TimeLeft
+        Hours, Seconds = divmod(Delta.seconds, 3600)
+        DueIn = f"{Delta.days}d {Hours:02d}h {Seconds // 60:02d}m"
+        if Overdue:
+            DueMessage = f"[Task overdue by {DueIn}]\n"
+        else:
+            DueMessage = f"[Task due in {DueIn}]\n"
+        PersonInCharge = Users.get(PersonInCharge)
+        Creator = Users.get(Creator)
+        Editor = Users.get(Editor)
+        Message = [
+            f"{DueMessage}",
+            f"Task ID: {TaskID}\n",
+            f"Title: {Title}\n",
+            f"Status: {Status}\n",
+            f"Person in charge: {PersonInCharge}\n",
+            f"Creation date: {CreationDate}\n",
+            f"Due date: {DueDateStr}\n",
+            f"Creator: {Creator}\n",
+            f"Editor: {Editor}\n",
+            f"Additional information: {AddtionalInfo}",
+        ]
+        Notifications.append("".join(Message))
+        Notifications.append(SEPARATOR)
     return Notifications
 
-def PrintNotification():
+def PrintNotification(out=None):
+    # Written in one call, same text as printing each entry on its own line; the text is returned so callers can check it directly
     Notifications = UpcomingTask()
     if Notifications is None:
-        return
-    for Task in Notifications:
-        print(Task)
\ No newline at end of file
+        return None
+    if not Notifications:
+        return ""
+    Text = "\n".join(Notifications) + "\n"
+    print(Text, end="", file=out)
+    return Text
\ No newline at end of file